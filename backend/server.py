@@ -17,19 +17,36 @@ if str(PARENT_DIR) not in sys.path:
 
 # Now we can import from parent directory
 import asyncio
+import base64
 import json
 import logging
-from typing import Any, Dict, List
-from queue import Queue
+import time
+import uuid
+from typing import Any, Dict, List, Optional
 from datetime import datetime
-from collections import defaultdict
-from threading import Lock
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 
-from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, StreamingResponse
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Request, Response, WebSocket, WebSocketDisconnect
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, ORJSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Optional: sse-starlette frames SSE natively and sends proxy keep-alive
+# pings; fall back to hand-rolled framing over StreamingResponse without it
+try:
+    from sse_starlette.sse import EventSourceResponse
+except ImportError:
+    EventSourceResponse = None
+
+# Optional: msgspec decodes the execute payload straight from raw bytes into
+# a C struct, skipping pydantic-core validation on the hot request path
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
 
 from adaptive_agent import AgentConfig, AgentResult, run_adaptive_agent
 from live_browser_manager import get_live_browser, close_live_browser
@@ -38,9 +55,88 @@ from live_browser_manager import get_live_browser, close_live_browser
 active_sessions = {}
 connected_websocket_clients = []
 
-# Control state globals (thread-safe)
+# Max agents running concurrently; extra /execute calls queue on the semaphore
+AGENT_MAX_CONCURRENCY = int(os.getenv("AGENT_MAX_CONCURRENCY", "4"))
+
+# Hard cap on running + queued agents; beyond this new requests get a 503
+# instead of piling up invisibly behind the executor
+AGENT_QUEUE_LIMIT = AGENT_MAX_CONCURRENCY * 2
+_agents_in_flight = 0
+
+
+def _acquire_agent_slot() -> None:
+    """Reserve a run slot or fail fast with 503 (called on the event loop)."""
+    global _agents_in_flight
+    if _agents_in_flight >= AGENT_QUEUE_LIMIT:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Agent capacity exhausted ({AGENT_QUEUE_LIMIT} in flight) - retry shortly",
+        )
+    _agents_in_flight += 1
+
+
+def _release_agent_slot() -> None:
+    global _agents_in_flight
+    _agents_in_flight -= 1
+
+
+# Recently completed successful runs keyed by the normalized request.
+# Dev and demo flows repeat identical tasks; a hit skips the multi-minute
+# agent run entirely. Only touched from the event loop, so no locking.
+RESULT_CACHE_TTL = float(os.getenv("AGENT_RESULT_CACHE_TTL", "300"))
+RESULT_CACHE_MAX = 256
+_result_cache: Dict[str, Any] = {}
+
+
+def _cache_key(request: "ExecuteRequest") -> str:
+    return json.dumps(
+        [request.task, request.model, sorted(request.tools), request.max_steps, request.headless]
+    )
+
+
+def _result_cache_get(key: str):
+    entry = _result_cache.get(key)
+    if entry is None:
+        return None
+    expires, result = entry
+    if time.monotonic() > expires:
+        del _result_cache[key]
+        return None
+    return result
+
+
+def _result_cache_put(key: str, result: Dict[str, Any]) -> None:
+    if len(_result_cache) >= RESULT_CACHE_MAX:
+        # Evict the oldest insertion (dicts preserve insertion order)
+        _result_cache.pop(next(iter(_result_cache)))
+    _result_cache[key] = (time.monotonic() + RESULT_CACHE_TTL, result)
+
+# How long progress events may sit in the agent thread before being flushed
+# to control WebSockets as one batch
+PROGRESS_FLUSH_INTERVAL = 0.05  # seconds
+
+# Cap on buffered stream events per client; a slow consumer loses the oldest
+# frames instead of growing server memory without bound
+EVENT_QUEUE_MAXSIZE = 256
+
+
+def _put_drop_oldest(event_queue: asyncio.Queue, event: Dict[str, Any], drops: List[int]) -> None:
+    """put_nowait that evicts the oldest queued event when full (runs on the loop)."""
+    try:
+        event_queue.put_nowait(event)
+    except asyncio.QueueFull:
+        try:
+            event_queue.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+        drops[0] += 1
+        event_queue.put_nowait(event)
+
+# Control state globals. Single-writer discipline: only the control WebSocket
+# handler (event loop) mutates these flags; the agent thread only reads them.
+# Plain bool stores/loads are atomic under the GIL, so no lock is needed -
+# taking a threading.Lock from the event loop would block every coroutine.
 CONTROL_STATE = defaultdict(lambda: {"paused": False, "stopped": False, "nudge": None})
-CONTROL_LOCK = Lock()
 CONTROL_CLIENTS = defaultdict(set)  # session_id -> set(WebSocket)
 
 logger = logging.getLogger("adaptive_agent.backend")
@@ -66,7 +162,13 @@ if not ANTHROPIC_API_KEY:
 logger.info(f"✅ ANTHROPIC_API_KEY is set (starts with {ANTHROPIC_API_KEY[:10]}...)")
 # =============================================================================
 
-app = FastAPI(title="Adaptive Agent Backend", version="1.0.0")
+# orjson for every dict-returning endpoint; prebuilt Response bodies
+# (/health, the GET / fallback) are unaffected
+app = FastAPI(
+    title="Adaptive Agent Backend",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 
 
 # =============================================================================
@@ -79,6 +181,14 @@ async def startup_event():
     app.state.loop = asyncio.get_running_loop()
     logger.info("✅ Captured main event loop for thread-safe operations")
 
+    # Dedicated executor for agent runs - the default loop executor is shared
+    # with everything else and its size is an implementation detail
+    app.state.agent_executor = ThreadPoolExecutor(
+        max_workers=AGENT_MAX_CONCURRENCY, thread_name_prefix="agent"
+    )
+    app.state.agent_semaphore = asyncio.Semaphore(AGENT_MAX_CONCURRENCY)
+    logger.info(f"✅ Agent executor ready ({AGENT_MAX_CONCURRENCY} workers)")
+
     try:
         logger.info("🚀 Initializing live browser manager...")
         browser = await get_live_browser()
@@ -91,6 +201,11 @@ async def startup_event():
 @app.on_event("shutdown")
 async def shutdown_event():
     """Close live browser on server shutdown."""
+    executor = getattr(app.state, "agent_executor", None)
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+        logger.info("✅ Agent executor shut down")
+
     try:
         logger.info("🔴 Shutting down live browser...")
         await close_live_browser()
@@ -99,28 +214,115 @@ async def shutdown_event():
         logger.error(f"❌ Error closing live browser: {e}")
 
 
-# Request logging middleware - LOG EVERY REQUEST
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    """Log every incoming HTTP request for debugging."""
-    logger.info(f"🔵 REQUEST: {request.method} {request.url.path} from {request.client.host}")
-    response = await call_next(request)
-    logger.info(f"✅ RESPONSE: {request.method} {request.url.path} → Status {response.status_code}")
-    return response
+# Concrete allowed origins (wildcard + credentials is rejected by browsers
+# anyway); override for deployments via a comma-separated CORS_ORIGINS
+_CORS_ORIGINS = tuple(
+    origin.strip()
+    for origin in os.getenv(
+        "CORS_ORIGINS", "http://localhost:5173,http://localhost:3000,http://localhost:8000"
+    ).split(",")
+    if origin.strip()
+)
 
 
-# Allow local development with the React UI
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+class APIMiddleware:
+    """Fused CORS + request-logging middleware (pure ASGI).
+
+    One middleware frame per request instead of two (CORSMiddleware plus a
+    BaseHTTPMiddleware logger). Header lists are built once per allowed
+    origin at init, so the per-request cost is a single dict lookup, and
+    OPTIONS preflights short-circuit without entering the app.
+    """
+
+    def __init__(self, app, allow_origins=_CORS_ORIGINS):
+        self.app = app
+        self._cors_by_origin = {}
+        self._preflight_by_origin = {}
+        for origin in allow_origins:
+            origin_bytes = origin.encode("latin-1")
+            cors_headers = [
+                (b"access-control-allow-origin", origin_bytes),
+                (b"access-control-allow-credentials", b"true"),
+                (b"vary", b"Origin"),
+            ]
+            self._cors_by_origin[origin_bytes] = cors_headers
+            self._preflight_by_origin[origin_bytes] = cors_headers + [
+                (b"access-control-allow-methods", b"GET, POST, OPTIONS"),
+                (b"access-control-allow-headers", b"Content-Type, Authorization"),
+                (b"access-control-max-age", b"600"),
+            ]
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        path = scope["path"]
+
+        origin = None
+        requests_method = False
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                requests_method = True
+
+        # Short-circuit genuine CORS preflights - Origin plus requested
+        # method - with a pre-built response. Plain OPTIONS without them
+        # (health probes, some proxies) fall through to the app, matching
+        # the baseline CORSMiddleware behavior.
+        if method == "OPTIONS" and origin is not None and requests_method:
+            preflight_headers = self._preflight_by_origin.get(origin)
+            if preflight_headers is None:
+                await send({"type": "http.response.start", "status": 400, "headers": []})
+                await send({"type": "http.response.body", "body": b"Disallowed CORS origin"})
+                return
+            await send({
+                "type": "http.response.start",
+                "status": 200,
+                "headers": preflight_headers,
+            })
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        # Same-origin requests (no Origin header) need no CORS headers
+        cors_headers = self._cors_by_origin.get(origin)
+
+        # With logging at WARNING or above (production), skip the log lines
+        # and the scope["client"] parse entirely
+        log_enabled = logger.isEnabledFor(logging.INFO)
+        if log_enabled:
+            client = scope.get("client")
+            host = client[0] if client else "-"
+            logger.info(f"🔵 REQUEST: {method} {path} from {host}")
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                if cors_headers is not None:
+                    message["headers"] = list(message.get("headers") or []) + cors_headers
+                if log_enabled:
+                    logger.info(f"✅ RESPONSE: {method} {path} → Status {message['status']}")
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+
+# Compress large JSON payloads (agent results can carry pages of extracted
+# data). The SSE stream opts out via Content-Encoding: identity - gzip would
+# buffer frames and destroy its low-latency property.
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# Allow local development with the React UI + log every request
+app.add_middleware(APIMiddleware)
 
 # Serve frontend static files if available (Spring Boot style integration)
+# stat() once at import time - these paths don't change while running
 STATIC_DIR = BACKEND_DIR / "static"
-if STATIC_DIR.exists():
+INDEX_PATH = STATIC_DIR / "index.html"
+HAS_STATIC = STATIC_DIR.exists()
+HAS_INDEX = INDEX_PATH.is_file()
+if HAS_STATIC:
     app.mount("/assets", StaticFiles(directory=STATIC_DIR / "assets"), name="assets")
     logger.info(f"✅ Serving frontend static files from {STATIC_DIR}")
 else:
@@ -130,6 +332,8 @@ else:
 class ExecuteRequest(BaseModel):
     """Payload expected from the frontend."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     task: str = Field(..., description="Task instruction for the agent")
     model: str = Field("claude", description="Model identifier to use")
     tools: List[str] = Field(default_factory=list, description="Enabled tool identifiers")
@@ -138,7 +342,16 @@ class ExecuteRequest(BaseModel):
 
 
 class ExecuteResponse(BaseModel):
-    """Structured response returned by the backend."""
+    """Schema of a finished agent result.
+
+    Not bound to an endpoint: /execute returns a session ack and the full
+    result is delivered as the "final" frame over the control WebSocket /
+    SSE stream, already orjson-encoded straight from AgentResult.to_dict()
+    without a Pydantic validation pass. Kept as the documented contract
+    for that frame.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     success: bool
     status: str
@@ -152,6 +365,43 @@ class ExecuteResponse(BaseModel):
     metadata: Dict[str, Any]
 
 
+if msgspec is not None:
+    class _ExecuteStruct(msgspec.Struct, forbid_unknown_fields=True):
+        """msgspec mirror of ExecuteRequest for fast body decoding."""
+
+        task: str
+        model: str = "claude"
+        tools: List[str] = []
+        headless: bool = False
+        max_steps: int = 40
+
+    _execute_decoder = msgspec.json.Decoder(_ExecuteStruct)
+
+
+async def parse_execute(request: Request) -> ExecuteRequest:
+    """Decode an ExecuteRequest from the raw body.
+
+    With msgspec installed, decoding goes bytes -> C struct and the pydantic
+    model is built via model_construct (no second validation pass); otherwise
+    pydantic-core parses the body directly.
+    """
+    body = await request.body()
+    if msgspec is None:
+        return ExecuteRequest.model_validate_json(body)
+    try:
+        struct = _execute_decoder.decode(body)
+    except msgspec.DecodeError as exc:
+        # Covers ValidationError (its subclass) and syntactically invalid JSON
+        raise HTTPException(status_code=422, detail=str(exc))
+    return ExecuteRequest.model_construct(
+        task=struct.task,
+        model=struct.model,
+        tools=struct.tools,
+        headless=struct.headless,
+        max_steps=struct.max_steps,
+    )
+
+
 class NavigateRequest(BaseModel):
     """Payload for manual navigation during Take Control mode."""
 
@@ -159,25 +409,75 @@ class NavigateRequest(BaseModel):
     session_id: str = Field(default="", description="Session ID (optional)")
 
 
+# Level-name -> numeric level, resolved once instead of a getattr with
+# fallback per event
+_LOG_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "warn": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+    "thinking": logging.INFO,
+}
+
+
+def _to_config(req: ExecuteRequest, **overrides: Any) -> AgentConfig:
+    """Build an AgentConfig from a request payload (field names align)."""
+
+    return AgentConfig(**req.model_dump(), **overrides)
+
+
 def _log_event(event: Dict[str, Any]) -> None:
     """Log progress events emitted by the agent."""
 
-    level = event.get("level", "info").lower()
-    message = event.get("message", "")
-    log_fn = getattr(logger, level, logger.info)
-    log_fn(message)
+    level = _LOG_LEVELS.get(event.get("level", "info").lower(), logging.INFO)
+    if logger.isEnabledFor(level):
+        logger.log(level, event.get("message", ""))
 
 
 @app.post("/execute")
-async def execute(request: ExecuteRequest) -> Dict[str, Any]:
+async def execute(request: ExecuteRequest = Depends(parse_execute)) -> Dict[str, Any]:
     """
     Start agent execution and return session_id for WebSocket connections.
 
     Returns:
         {"session_id": "uuid", "accepted": true}
     """
+    # Serve identical recent requests from cache without burning an agent run
+    cache_key = _cache_key(request)
+    cached_result = _result_cache_get(cache_key)
+    if cached_result is not None:
+        session_id = str(uuid.uuid4())
+        logger.info(f"♻️  Cache hit - returning stored result (session_id: {session_id})")
+        active_sessions[session_id] = {
+            "task": request.task,
+            "model": request.model,
+            "tools": request.tools,
+            "status": "complete",
+            "cached": True,
+            "result": cached_result,
+            "final_pending": True,
+            "created_at": datetime.now().isoformat()
+        }
+
+        async def send_cached_final():
+            # Give the client a moment to open its control WebSocket. If it
+            # attaches later than this (slow network, proxy), the connect
+            # handler replays the pending final from the session record, so
+            # the result can't be dropped either way.
+            await asyncio.sleep(0.5)
+            session = active_sessions.get(session_id)
+            if (session is not None and CONTROL_CLIENTS.get(session_id)
+                    and session.pop("final_pending", False)):
+                await send_control_event(session_id, {"type": "final", "result": cached_result})
+
+        asyncio.create_task(send_cached_final())
+        return {"session_id": session_id, "accepted": True, "cached": True}
+
+    _acquire_agent_slot()
+
     # Generate unique session ID
-    import uuid
     session_id = str(uuid.uuid4())
 
     logger.info(f"🚀 Starting agent execution with session_id: {session_id}")
@@ -197,21 +497,73 @@ async def execute(request: ExecuteRequest) -> Dict[str, Any]:
         send_browser_frame(session_id, frame_b64, url)
 
     # Create config with control state (defaultdict auto-creates entry)
-    config = AgentConfig(
-        task=request.task,
-        model=request.model,
-        tools=request.tools,
-        max_steps=request.max_steps,
-        headless=request.headless,
+    config = _to_config(
+        request,
         control_state=CONTROL_STATE[session_id],
-        stream_callback=stream_callback
+        stream_callback=stream_callback,
     )
 
+    # Coalesce chatty progress events in the agent thread: each thread-safe
+    # send is a cross-thread wakeup of the event loop, so batching turns N
+    # wakeups per step into one
+    event_buffer: deque = deque()
+    last_flush = 0.0
+    flush_handle: Optional[asyncio.TimerHandle] = None  # touched on the loop only
+
+    def _drain_batch() -> Optional[Dict[str, Any]]:
+        """Pop everything buffered into one control-channel payload."""
+        batch = []
+        while True:
+            try:
+                batch.append(event_buffer.popleft())
+            except IndexError:
+                break
+        if not batch:
+            return None
+        if len(batch) == 1:
+            return batch[0]
+        return {"type": "batch", "events": batch}
+
+    def flush_progress_events():
+        """Drain the buffer into a single control-channel send (agent thread)."""
+        payload = _drain_batch()
+        if payload is not None:
+            send_control_event_threadsafe(session_id, payload)
+
+    def _flush_on_loop():
+        # Timer callback - already on the event loop, so the send is
+        # scheduled directly; the threadsafe bridge blocks on its own
+        # future and would deadlock the loop from here
+        nonlocal flush_handle, last_flush
+        flush_handle = None
+        payload = _drain_batch()
+        if payload is not None:
+            asyncio.ensure_future(send_control_event(session_id, payload))
+            last_flush = time.monotonic()
+
+    def _arm_flush_timer():
+        # Loop-side: at most one pending timer per session
+        nonlocal flush_handle
+        if flush_handle is None and event_buffer:
+            flush_handle = loop.call_later(PROGRESS_FLUSH_INTERVAL, _flush_on_loop)
+
     def sync_progress_callback(event: Dict[str, Any]):
         """Thread-safe progress callback for background agent execution."""
+        nonlocal last_flush
         _log_event(event)
-        # Send to WebSocket using thread-safe method
-        send_control_event_threadsafe(session_id, event)
+        event_buffer.append(event)
+        now = time.monotonic()
+        # Errors bypass the batching window; everything else flushes at most
+        # every PROGRESS_FLUSH_INTERVAL seconds
+        if event.get("level") == "error" or now - last_flush >= PROGRESS_FLUSH_INTERVAL:
+            flush_progress_events()
+            last_flush = now
+        else:
+            # Steps print in a burst and then block in a long Claude/browser
+            # call; without a timer the tail of the burst would sit buffered
+            # until the next event arrives. Arm a loop-side flush so it goes
+            # out within the batching window regardless.
+            loop.call_soon_threadsafe(_arm_flush_timer)
 
     # Start agent execution in background
     loop = asyncio.get_running_loop()
@@ -226,9 +578,19 @@ async def execute(request: ExecuteRequest) -> Dict[str, Any]:
             })
 
             # Execute agent (runs in background thread - will use threadsafe callback)
-            result: AgentResult = await loop.run_in_executor(
-                None, lambda: run_adaptive_agent(config, progress_callback=sync_progress_callback)
-            )
+            async with app.state.agent_semaphore:
+                result: AgentResult = await loop.run_in_executor(
+                    app.state.agent_executor,
+                    lambda: run_adaptive_agent(config, progress_callback=sync_progress_callback),
+                )
+
+            # Deliver any events still sitting in the batching buffer.
+            # We're on the event loop here, so drain and send directly -
+            # flush_progress_events would block on the threadsafe bridge's
+            # future, which can't complete while the loop is blocked.
+            payload = _drain_batch()
+            if payload is not None:
+                await send_control_event(session_id, payload)
 
             # Send final result (we're back on the main loop here, so regular await is fine)
             await send_control_event(session_id, {
@@ -240,6 +602,10 @@ async def execute(request: ExecuteRequest) -> Dict[str, Any]:
             active_sessions[session_id]["status"] = "complete" if result.success else "failed"
             active_sessions[session_id]["result"] = result.to_dict()
 
+            # Only successful runs are worth replaying for identical requests
+            if result.success:
+                _result_cache_put(cache_key, result.to_dict())
+
         except Exception as exc:
             logger.exception(f"Agent execution failed for session {session_id}")
 
@@ -253,6 +619,9 @@ async def execute(request: ExecuteRequest) -> Dict[str, Any]:
             active_sessions[session_id]["status"] = "error"
             active_sessions[session_id]["error"] = str(exc)
 
+        finally:
+            _release_agent_slot()
+
     # Start agent execution as background task
     asyncio.create_task(run_agent())
 
@@ -263,9 +632,11 @@ async def execute(request: ExecuteRequest) -> Dict[str, Any]:
 
 
 @app.post("/execute/stream")
-async def execute_stream(request: ExecuteRequest):
+async def execute_stream(request: ExecuteRequest = Depends(parse_execute)):
     """Execute the adaptive agent with real-time streaming updates including screenshots."""
 
+    _acquire_agent_slot()
+
     # CRITICAL: Close any existing LiveBrowserManager to avoid browser conflicts
     # The agent will create its own sync Playwright browser
     logger.info("🔄 Closing LiveBrowserManager to prevent browser conflicts...")
@@ -278,64 +649,110 @@ async def execute_stream(request: ExecuteRequest):
     except Exception as e:
         logger.warning(f"⚠️  LiveBrowserManager close failed (may not be running): {e}")
 
-    event_queue = Queue()
+    # asyncio.Queue fed from the agent thread via the loop's wakeup pipe:
+    # one fd write per event, no Python-level lock (queue.Queue takes a
+    # threading.Lock on every put/get)
+    loop = asyncio.get_running_loop()
+    event_queue: asyncio.Queue = asyncio.Queue(maxsize=EVENT_QUEUE_MAXSIZE)
+    dropped = [0]
 
     def progress_handler(event: Dict[str, Any]) -> None:
         """Capture progress events and screenshots for streaming."""
-        event_queue.put(event)
-
-    config = AgentConfig(
-        task=request.task,
-        model=request.model,
-        tools=request.tools,
-        max_steps=request.max_steps,
-        headless=request.headless,
-    )
+        loop.call_soon_threadsafe(_put_drop_oldest, event_queue, event, dropped)
+
+    config = _to_config(request)
 
     async def event_generator():
         """Stream events to the frontend in real-time."""
-        loop = asyncio.get_running_loop()
-
         logger.info(f"🚀 Starting agent execution for task: {config.task[:50]}...")
         logger.info(f"   Config: headless={config.headless}, max_steps={config.max_steps}")
 
         # Start agent execution in background
         try:
             agent_task = loop.run_in_executor(
-                None, lambda: run_adaptive_agent(config, progress_callback=progress_handler)
+                app.state.agent_executor,
+                lambda: run_adaptive_agent(config, progress_callback=progress_handler),
             )
             logger.info(f"✅ Agent task started in executor")
         except Exception as e:
             logger.error(f"❌ Failed to start agent task: {e}")
-            yield f"data: {json.dumps({'type': 'error', 'message': f'Failed to start agent: {str(e)}'})}\n\n"
+            _release_agent_slot()
+            yield orjson.dumps({'type': 'error', 'message': f'Failed to start agent: {str(e)}'}).decode()
             return
 
-        # Stream events as they arrive
-        while True:
-            # Check if agent is done
-            if agent_task.done():
-                # Send final result
-                try:
-                    result = agent_task.result()
-                    yield f"data: {json.dumps({'type': 'final', 'result': result.to_dict()})}\n\n"
-                except Exception as exc:
-                    yield f"data: {json.dumps({'type': 'error', 'message': str(exc)})}\n\n"
-                break
+        # Stream events as they arrive: race the queue against the agent
+        # future instead of polling with sleep(0.1), so events go out the
+        # moment they land on the loop
+        pending_get = asyncio.ensure_future(event_queue.get())
+        try:
+            while True:
+                done, _ = await asyncio.wait(
+                    {pending_get, agent_task},
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+
+                if pending_get in done:
+                    # Drain everything that arrived in this wakeup into one
+                    # frame - fewer SSE frames means fewer chunked-encode
+                    # flushes for bursty steps (screenshot + log + step event)
+                    batch = [pending_get.result()]
+                    while True:
+                        try:
+                            batch.append(event_queue.get_nowait())
+                        except asyncio.QueueEmpty:
+                            break
+                    if len(batch) == 1:
+                        yield orjson.dumps({'type': 'event', 'event': batch[0]}).decode()
+                    else:
+                        yield orjson.dumps({'type': 'events', 'events': batch}).decode()
+                    pending_get = asyncio.ensure_future(event_queue.get())
+
+                if agent_task in done:
+                    # Drain events the agent emitted just before finishing
+                    tail = []
+                    while not event_queue.empty():
+                        tail.append(event_queue.get_nowait())
+                    if tail:
+                        yield orjson.dumps({'type': 'events', 'events': tail}).decode()
+
+                    # Send final result
+                    try:
+                        result = agent_task.result()
+                        final = {'type': 'final', 'result': result.to_dict()}
+                        if dropped[0]:
+                            logger.warning(f"⚠️  Dropped {dropped[0]} stream events (slow consumer)")
+                            final['dropped_events'] = dropped[0]
+                        yield orjson.dumps(final).decode()
+                    except Exception as exc:
+                        yield orjson.dumps({'type': 'error', 'message': str(exc)}).decode()
+                    break
+        finally:
+            pending_get.cancel()
+            _release_agent_slot()
+
+    # Content-Encoding: identity makes GZipMiddleware leave the stream alone;
+    # X-Accel-Buffering: no stops nginx-style proxies from buffering frames
+    stream_headers = {
+        "Content-Encoding": "identity",
+        "X-Accel-Buffering": "no",
+    }
 
-            # Send queued events
-            while not event_queue.empty():
-                event = event_queue.get()
-                yield f"data: {json.dumps({'type': 'event', 'event': event})}\n\n"
+    if EventSourceResponse is not None:
+        # sse-starlette handles framing, cache headers and 15s keep-alive
+        # ping comments (stops proxies dropping long idle agent runs)
+        return EventSourceResponse(event_generator(), ping=15, headers=stream_headers)
 
-            # Small delay to avoid busy waiting
-            await asyncio.sleep(0.1)
+    async def sse_frames():
+        async for payload in event_generator():
+            yield f"data: {payload}\n\n"
 
     return StreamingResponse(
-        event_generator(),
+        sse_frames(),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
             "Connection": "keep-alive",
+            **stream_headers,
         }
     )
 
@@ -365,6 +782,160 @@ async def navigate(request: NavigateRequest):
     }
 
 
+KEEPALIVE_INTERVAL = 30.0  # seconds between server-initiated pings
+
+
+# =============================================================================
+# Browser WebSocket command handlers (dict dispatch - O(1) per message)
+# =============================================================================
+async def _handle_navigate(websocket: WebSocket, browser_manager, message: Dict[str, Any]):
+    url = message.get('url')
+    if url:
+        await browser_manager.navigate(url)
+        await websocket.send_json({
+            'type': 'command_ack',
+            'command': 'navigate',
+            'url': url
+        })
+
+
+async def _handle_click(websocket: WebSocket, browser_manager, message: Dict[str, Any]):
+    x = message.get('x')
+    y = message.get('y')
+    if x is not None and y is not None:
+        await browser_manager.click(int(x), int(y))
+        await websocket.send_json({
+            'type': 'command_ack',
+            'command': 'click',
+            'x': x,
+            'y': y
+        })
+
+
+async def _handle_type(websocket: WebSocket, browser_manager, message: Dict[str, Any]):
+    text = message.get('text')
+    if text:
+        await browser_manager.type_text(text)
+        await websocket.send_json({
+            'type': 'command_ack',
+            'command': 'type',
+            'length': len(text)
+        })
+
+
+async def _handle_scroll(websocket: WebSocket, browser_manager, message: Dict[str, Any]):
+    delta = message.get('delta', 0)
+    await browser_manager.scroll(int(delta))
+    await websocket.send_json({
+        'type': 'command_ack',
+        'command': 'scroll',
+        'delta': delta
+    })
+
+
+async def _handle_key(websocket: WebSocket, browser_manager, message: Dict[str, Any]):
+    key = message.get('key')
+    if key:
+        await browser_manager.press_key(key)
+        await websocket.send_json({
+            'type': 'command_ack',
+            'command': 'key',
+            'key': key
+        })
+
+
+async def _handle_chain(websocket: WebSocket, browser_manager, message: Dict[str, Any]):
+    actions = message.get('actions')
+    if actions:
+        observed = await browser_manager.chain(actions)
+        await websocket.send_json({
+            'type': 'command_ack',
+            'command': 'chain',
+            'count': len(actions),
+            **observed
+        })
+
+
+async def _handle_ping(websocket: WebSocket, browser_manager, message: Dict[str, Any]):
+    # Heartbeat/keepalive
+    await websocket.send_text(_PONG_TEMPLATE % datetime.now().isoformat())
+
+
+async def _handle_pong(websocket: WebSocket, browser_manager, message: Dict[str, Any]):
+    # Keepalive response from client - nothing to do
+    pass
+
+
+BROWSER_HANDLERS = {
+    'navigate': _handle_navigate,
+    'click': _handle_click,
+    'type': _handle_type,
+    'scroll': _handle_scroll,
+    'key': _handle_key,
+    'chain': _handle_chain,
+    'ping': _handle_ping,
+    'pong': _handle_pong,
+}
+
+
+# Control channel commands: each mutates the session's control state
+def _control_pause(state: Dict[str, Any], msg: Dict[str, Any]):
+    state["paused"] = True
+
+
+def _control_resume(state: Dict[str, Any], msg: Dict[str, Any]):
+    state["paused"] = False
+
+
+def _control_stop(state: Dict[str, Any], msg: Dict[str, Any]):
+    state["stopped"] = True
+
+
+def _control_nudge(state: Dict[str, Any], msg: Dict[str, Any]):
+    state["nudge"] = msg.get("text")
+
+
+def _control_ping(state: Dict[str, Any], msg: Dict[str, Any]):
+    # Just ack, no state change
+    pass
+
+
+CONTROL_HANDLERS = {
+    "pause": _control_pause,
+    "resume": _control_resume,
+    "stop": _control_stop,
+    "nudge": _control_nudge,
+    "ping": _control_ping,
+}
+
+# Pre-serialized frames for messages whose JSON never changes - skips the
+# dict build + json.dumps per send
+_PING_FRAME = '{"type":"ping"}'
+_PONG_TEMPLATE = '{"type":"pong","timestamp":"%s"}'
+_CONTROL_ACK_FRAMES = {
+    cmd: json.dumps({"type": "command_ack", "command": cmd})
+    for cmd in CONTROL_HANDLERS
+}
+
+
+async def _keepalive_pinger(websocket: WebSocket):
+    """Send a periodic ping so idle connections stay alive.
+
+    Runs as a single background task per connection; cheaper than wrapping
+    every receive in asyncio.wait_for (which allocates a TimerHandle per
+    message just to cancel it again).
+    """
+    try:
+        while True:
+            await asyncio.sleep(KEEPALIVE_INTERVAL)
+            await websocket.send_text(_PING_FRAME)
+    except asyncio.CancelledError:
+        raise
+    except Exception:
+        # Connection is gone; the receive loop will notice and clean up
+        pass
+
+
 @app.websocket("/ws/browser")
 async def websocket_browser_stream(websocket: WebSocket):
     """
@@ -382,26 +953,37 @@ async def websocket_browser_stream(websocket: WebSocket):
 
     logger.info(f"🔵 WebSocket connected: {client_id} (total: {len(connected_websocket_clients)})")
 
+    keepalive_task = None
+
     try:
         # Get the live browser instance
         browser_manager = await get_live_browser()
 
-        # Define frame callback to send frames to this client
-        async def send_frame_to_client(frame_data: str, url: str):
+        # Define frame callback to send frames to this client. Same JSON
+        # header + binary frame split as _send_stream_event: the header
+        # carries url/metadata, the raw JPEG bytes follow without the ~33%
+        # base64-in-JSON inflation.
+        # Frame deliveries may run as concurrent tasks; the lock keeps each
+        # header/bytes pair contiguous on the wire
+        frame_send_lock = asyncio.Lock()
+
+        async def send_frame_to_client(frame_bytes: bytes, url: str):
             """Send frame to this specific WebSocket client."""
             try:
-                await websocket.send_json({
-                    'type': 'frame',
-                    'data': frame_data,  # Base64 JPEG
-                    'url': url,
-                    'timestamp': datetime.now().isoformat()
-                })
+                async with frame_send_lock:
+                    await websocket.send_json({
+                        'type': 'frame',
+                        'binary': True,
+                        'url': url,
+                        'timestamp': datetime.now().isoformat()
+                    })
+                    await websocket.send_bytes(frame_bytes)
             except Exception as e:
                 logger.error(f"❌ Failed to send frame to {client_id}: {e}")
 
         # Start streaming to this client
         logger.info(f"🎬 Starting stream for {client_id}")
-        await browser_manager.start_streaming(send_frame_to_client, fps=20)
+        await browser_manager.start_streaming(send_frame_to_client, fps=20, binary=True)
 
         # Send initial connection confirmation
         await websocket.send_json({
@@ -410,85 +992,22 @@ async def websocket_browser_stream(websocket: WebSocket):
             'fps': 20
         })
 
+        # Single background pinger instead of a timeout per receive call
+        # (asyncio.wait_for allocates and cancels a TimerHandle on every message)
+        keepalive_task = asyncio.create_task(_keepalive_pinger(websocket))
+
         # Listen for commands from client
-        while True:
+        async for message in websocket.iter_json():
             try:
-                message = await asyncio.wait_for(websocket.receive_json(), timeout=30.0)
-
                 command_type = message.get('type')
                 logger.info(f"🎮 Command from {client_id}: {command_type}")
 
-                if command_type == 'navigate':
-                    url = message.get('url')
-                    if url:
-                        await browser_manager.navigate(url)
-                        await websocket.send_json({
-                            'type': 'command_ack',
-                            'command': 'navigate',
-                            'url': url
-                        })
-
-                elif command_type == 'click':
-                    x = message.get('x')
-                    y = message.get('y')
-                    if x is not None and y is not None:
-                        await browser_manager.click(int(x), int(y))
-                        await websocket.send_json({
-                            'type': 'command_ack',
-                            'command': 'click',
-                            'x': x,
-                            'y': y
-                        })
-
-                elif command_type == 'type':
-                    text = message.get('text')
-                    if text:
-                        await browser_manager.type_text(text)
-                        await websocket.send_json({
-                            'type': 'command_ack',
-                            'command': 'type',
-                            'length': len(text)
-                        })
-
-                elif command_type == 'scroll':
-                    delta = message.get('delta', 0)
-                    await browser_manager.scroll(int(delta))
-                    await websocket.send_json({
-                        'type': 'command_ack',
-                        'command': 'scroll',
-                        'delta': delta
-                    })
-
-                elif command_type == 'key':
-                    key = message.get('key')
-                    if key:
-                        await browser_manager.press_key(key)
-                        await websocket.send_json({
-                            'type': 'command_ack',
-                            'command': 'key',
-                            'key': key
-                        })
-
-                elif command_type == 'ping':
-                    # Heartbeat/keepalive
-                    await websocket.send_json({
-                        'type': 'pong',
-                        'timestamp': datetime.now().isoformat()
-                    })
-
-                elif command_type == 'pong':
-                    # Keepalive response from client - just continue
-                    continue
-
+                handler = BROWSER_HANDLERS.get(command_type)
+                if handler:
+                    await handler(websocket, browser_manager, message)
                 else:
                     logger.warning(f"⚠️  Unknown command type: {command_type}")
 
-            except asyncio.TimeoutError:
-                # Send keepalive ping
-                try:
-                    await websocket.send_json({'type': 'ping'})
-                except:
-                    break
             except WebSocketDisconnect:
                 break
             except Exception as e:
@@ -503,6 +1022,9 @@ async def websocket_browser_stream(websocket: WebSocket):
 
     finally:
         # Clean up
+        if keepalive_task is not None:
+            keepalive_task.cancel()
+
         if websocket in connected_websocket_clients:
             connected_websocket_clients.remove(websocket)
 
@@ -518,6 +1040,109 @@ async def websocket_browser_stream(websocket: WebSocket):
                 pass
 
 
+async def _send_stream_event(websocket: WebSocket, event: Dict[str, Any]):
+    """Send one agent event; screenshots go out as raw binary frames.
+
+    A screenshot event is split into a small JSON header (the event minus
+    its base64 image, flagged with "binary": true) followed by one binary
+    frame carrying the raw image bytes - avoiding the ~33% base64-in-JSON
+    inflation on the largest payloads.
+    """
+    payload = event.get("payload")
+    if payload and payload.get("type") == "screenshot" and payload.get("image"):
+        meta_payload = {k: v for k, v in payload.items() if k != "image"}
+        meta_payload["binary"] = True
+        meta = {**event, "payload": meta_payload}
+        await websocket.send_text(orjson.dumps({'type': 'event', 'event': meta}).decode())
+        await websocket.send_bytes(base64.b64decode(payload["image"]))
+    else:
+        await websocket.send_text(orjson.dumps({'type': 'event', 'event': event}).decode())
+
+
+@app.websocket("/ws/stream")
+async def websocket_agent_stream(websocket: WebSocket):
+    """
+    WebSocket alternative to /execute/stream with binary screenshot frames.
+
+    The client sends one ExecuteRequest-shaped JSON message; progress events
+    come back as JSON text frames, except screenshots which arrive as a JSON
+    header frame immediately followed by a binary frame of image bytes.
+    """
+    await websocket.accept()
+
+    try:
+        params = await websocket.receive_json()
+        request = ExecuteRequest(**params)
+    except WebSocketDisconnect:
+        return
+    except Exception as e:
+        logger.error(f"❌ Invalid /ws/stream request payload: {e}")
+        await websocket.close(code=1003)
+        return
+
+    # The slot helper raises HTTPException, which Starlette can't render on
+    # a websocket scope - the connection would just hang open. Check
+    # capacity explicitly and close with a proper frame instead.
+    if _agents_in_flight >= AGENT_QUEUE_LIMIT:
+        await websocket.send_json({
+            "type": "error",
+            "message": f"Agent capacity exhausted ({AGENT_QUEUE_LIMIT} in flight) - retry shortly",
+        })
+        await websocket.close(code=1013)  # Try Again Later
+        return
+
+    _acquire_agent_slot()
+
+    loop = asyncio.get_running_loop()
+    event_queue: asyncio.Queue = asyncio.Queue(maxsize=EVENT_QUEUE_MAXSIZE)
+    dropped = [0]
+
+    def progress_handler(event: Dict[str, Any]) -> None:
+        loop.call_soon_threadsafe(_put_drop_oldest, event_queue, event, dropped)
+
+    config = _to_config(request)
+
+    agent_task = loop.run_in_executor(
+        app.state.agent_executor,
+        lambda: run_adaptive_agent(config, progress_callback=progress_handler),
+    )
+
+    pending_get = asyncio.ensure_future(event_queue.get())
+    try:
+        while True:
+            done, _ = await asyncio.wait(
+                {pending_get, agent_task},
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+
+            if pending_get in done:
+                await _send_stream_event(websocket, pending_get.result())
+                pending_get = asyncio.ensure_future(event_queue.get())
+
+            if agent_task in done:
+                while not event_queue.empty():
+                    await _send_stream_event(websocket, event_queue.get_nowait())
+                try:
+                    result = agent_task.result()
+                    final = {'type': 'final', 'result': result.to_dict()}
+                    if dropped[0]:
+                        logger.warning(f"⚠️  Dropped {dropped[0]} stream events (slow consumer)")
+                        final['dropped_events'] = dropped[0]
+                    await websocket.send_text(orjson.dumps(final).decode())
+                except Exception as exc:
+                    await websocket.send_text(
+                        orjson.dumps({'type': 'error', 'message': str(exc)}).decode()
+                    )
+                break
+
+    except WebSocketDisconnect:
+        logger.info("🔴 /ws/stream client disconnected mid-run")
+
+    finally:
+        pending_get.cancel()
+        _release_agent_slot()
+
+
 @app.websocket("/ws/control")
 async def websocket_control_channel(websocket: WebSocket):
     """
@@ -543,29 +1168,32 @@ async def websocket_control_channel(websocket: WebSocket):
     # Store in CONTROL_CLIENTS set
     CONTROL_CLIENTS[session_id].add(websocket)
 
+    # Cached-result sessions fire their final event shortly after /execute;
+    # a socket that attaches after that would otherwise never see it (there
+    # is no poll endpoint to recover a missed final). The pending flag is
+    # claimed with pop so the result is delivered exactly once.
+    session = active_sessions.get(session_id)
+    if session is not None and session.pop("final_pending", False):
+        await websocket.send_json({"type": "final", "result": session["result"]})
+
+    keepalive_task = asyncio.create_task(_keepalive_pinger(websocket))
+
     try:
-        while True:
-            msg = await websocket.receive_json()
+        async for msg in websocket.iter_json():
             cmd = msg.get("type")
 
             logger.info(f"🎮 Control command: {cmd} (session: {session_id})")
 
-            # Update control state
-            with CONTROL_LOCK:
-                if cmd == "pause":
-                    CONTROL_STATE[session_id]["paused"] = True
-                elif cmd == "resume":
-                    CONTROL_STATE[session_id]["paused"] = False
-                elif cmd == "stop":
-                    CONTROL_STATE[session_id]["stopped"] = True
-                elif cmd == "nudge":
-                    CONTROL_STATE[session_id]["nudge"] = msg.get("text")
-                elif cmd == "ping":
-                    # Just ack, no state change
-                    pass
-
-            # Echo acknowledgment
-            await websocket.send_json({"type": "command_ack", "command": cmd})
+            # Update control state (we are the only writer - see CONTROL_STATE)
+            handler = CONTROL_HANDLERS.get(cmd)
+            if handler:
+                handler(CONTROL_STATE[session_id], msg)
+
+            # Echo acknowledgment (pre-serialized for the known command set)
+            ack = _CONTROL_ACK_FRAMES.get(cmd)
+            if ack is None:
+                ack = json.dumps({"type": "command_ack", "command": cmd})
+            await websocket.send_text(ack)
 
     except WebSocketDisconnect:
         logger.info(f"🔴 Control WS disconnected (session: {session_id})")
@@ -575,6 +1203,7 @@ async def websocket_control_channel(websocket: WebSocket):
 
     finally:
         # Clean up
+        keepalive_task.cancel()
         CONTROL_CLIENTS[session_id].discard(websocket)
         logger.info(f"🔴 Control WS closed (session: {session_id})")
 
@@ -621,52 +1250,90 @@ def send_browser_frame(session_id: str, frame_b64: str, url: str):
     send_control_event_threadsafe(session_id, event)
 
 
+# The /health payload is static for the process lifetime, so serialize it
+# once - load balancers poll this endpoint constantly
+_HEALTH_BYTES = orjson.dumps({
+    "status": "healthy",
+    "version": "2.0.0",
+    "endpoints": {
+        "execute": "/execute",
+        "execute_stream": "/execute/stream",
+        "navigate": "/navigate",
+        "live_browser_ws": "/ws/browser",
+        "agent_stream_ws": "/ws/stream",
+        "control_ws": "/ws/control",
+        "health": "/health",
+        "stats": "/stats",
+        "docs": "/docs"
+    },
+    "features": {
+        "screenshot_streaming": True,
+        "live_browser_streaming": True,
+        "manual_control": True,
+        "interactive_browser": True,
+        "integrated_frontend": HAS_STATIC,
+        "control_channel": True
+    },
+})
+
+
+# Fallback body for GET / when the frontend bundle isn't built
+_NO_FRONTEND_BYTES = orjson.dumps({
+    "message": "Adaptive Agent Backend API",
+    "version": "1.0.0",
+    "note": "Frontend not built. Run 'npm run build' in frontend directory and copy dist/ to backend/static/",
+    "api_docs": "/docs"
+})
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint to verify backend is running."""
+    return Response(content=_HEALTH_BYTES, media_type="application/json")
+
+
+@app.get("/stats")
+async def connection_stats():
+    """Live connection counters (previously embedded in /health)."""
     return {
-        "status": "healthy",
-        "version": "2.0.0",
-        "endpoints": {
-            "execute": "/execute",
-            "execute_stream": "/execute/stream",
-            "navigate": "/navigate",
-            "live_browser_ws": "/ws/browser",
-            "control_ws": "/ws/control",
-            "health": "/health",
-            "docs": "/docs"
-        },
-        "features": {
-            "screenshot_streaming": True,
-            "live_browser_streaming": True,
-            "manual_control": True,
-            "interactive_browser": True,
-            "integrated_frontend": STATIC_DIR.exists(),
-            "control_channel": True
-        },
         "websocket": {
             "active_browser_connections": len(connected_websocket_clients),
             "active_control_connections": sum(len(clients) for clients in CONTROL_CLIENTS.values())
-        }
+        },
+        "agents_in_flight": _agents_in_flight,
     }
 
 
 @app.get("/")
 async def serve_frontend():
     """Serve the frontend index.html (Spring Boot style single app)."""
-    index_path = STATIC_DIR / "index.html"
-    if index_path.exists():
-        return FileResponse(index_path)
+    if HAS_INDEX:
+        return FileResponse(INDEX_PATH)
     else:
-        return {
-            "message": "Adaptive Agent Backend API",
-            "version": "1.0.0",
-            "note": "Frontend not built. Run 'npm run build' in frontend directory and copy dist/ to backend/static/",
-            "api_docs": "/docs"
-        }
+        return Response(content=_NO_FRONTEND_BYTES, media_type="application/json")
 
 
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("backend.server:app", host="0.0.0.0", port=8000, reload=False)
+    # uvloop is POSIX-only (uvicorn[standard] ships it there); fall back to
+    # the default loop on Windows. "auto" http picks httptools when present.
+    try:
+        import uvloop  # noqa: F401
+        loop_impl = "uvloop"
+    except ImportError:
+        loop_impl = "auto"
+
+    # NOTE: workers > 1 gives each worker its own in-memory session/control
+    # state and live browser. Keep 1 unless sessions move to a shared store.
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+
+    uvicorn.run(
+        "backend.server:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=False,
+        loop=loop_impl,
+        http="auto",
+        workers=workers,
+    )
@@ -1,15 +1,79 @@
 # computational_env.py - COMPUTATIONAL ENVIRONMENT LIKE MANUS AI
 # Provides terminal, code editor, file system access for the agent
 
+import fnmatch
+import functools
+import hashlib
 import os
+import struct
 import subprocess
+import sys
 import tempfile
+import threading
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 import json
 
+@functools.lru_cache(maxsize=128)
+def _syntax_error(code: str) -> Optional[str]:
+    """Syntax-check a snippet without a worker round-trip.
+
+    Returns the error message for invalid code, None when it parses.
+    Agents re-run identical snippets often, so the verdict is cached by
+    source text.
+    """
+    try:
+        compile(code, '<agent>', 'exec')
+    except SyntaxError as e:
+        return str(e)
+    return None
+
+
+def _content_fingerprint(content: str) -> Tuple[int, bytes]:
+    """(length, digest) pair cached per file instead of the full content -
+    identity checks still work but memory cost stays constant."""
+    return len(content), hashlib.blake2b(content.encode(), digest_size=16).digest()
+
+
+# Dispatcher run inside the persistent worker interpreter: length-prefixed
+# JSON requests on stdin, length-prefixed JSON results on stdout. Globals
+# persist across cells (Jupyter-kernel style), so imports are paid once.
+_WORKER_DISPATCHER = r'''
+import contextlib, io, json, struct, sys, time, traceback
+
+_globals = {"__name__": "__main__"}
+stdin = sys.stdin.buffer
+stdout = sys.stdout.buffer
+
+while True:
+    header = stdin.read(4)
+    if len(header) < 4:
+        break
+    (length,) = struct.unpack(">I", header)
+    request = json.loads(stdin.read(length))
+    out, err = io.StringIO(), io.StringIO()
+    start = time.time()
+    exit_code = 0
+    try:
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            exec(compile(request["code"], "<cell>", "exec"), _globals)
+    except BaseException:
+        err.write(traceback.format_exc())
+        exit_code = 1
+    payload = json.dumps({
+        "output": out.getvalue(),
+        "error": err.getvalue(),
+        "exit_code": exit_code,
+        "execution_time": time.time() - start,
+    }).encode()
+    stdout.write(struct.pack(">I", len(payload)))
+    stdout.write(payload)
+    stdout.flush()
+'''
+
 @dataclass
 class ExecutionResult:
     """Result from executing code or commands"""
@@ -36,6 +100,8 @@ class ComputationalEnvironment:
         self.workspace.mkdir(parents=True, exist_ok=True)
         self.command_history = []
         self.file_cache = {}
+        self._worker: Optional[subprocess.Popen] = None  # spawned on first use
+        self._env_info_cache: Optional[Tuple[float, Dict[str, Any]]] = None  # (expiry, info)
 
     def execute_terminal_command(self, command: str, cwd: Optional[str] = None, timeout: int = 30) -> ExecutionResult:
         """
@@ -101,7 +167,14 @@ class ComputationalEnvironment:
 
     def execute_python_code(self, code: str, timeout: int = 30) -> ExecutionResult:
         """
-        Execute Python code in an isolated environment
+        Execute Python code in the persistent worker interpreter
+
+        The worker amortizes interpreter startup and heavy imports across
+        calls, and keeps snippet stdout isolated from this process. Running
+        snippets in-process behind redirect_stdout is not an option here:
+        that swaps the process-global sys.stdout, so concurrent agent
+        threads' print output gets captured into the snippet's buffer and
+        vanishes from their progress streams.
 
         Args:
             code: Python code to execute
@@ -110,30 +183,97 @@ class ComputationalEnvironment:
         Returns:
             ExecutionResult with output
         """
-        # Create a temporary Python file
-        temp_file = self.workspace / f"temp_script_{len(self.command_history)}.py"
-        temp_file.write_text(code)
+        error = _syntax_error(code)
+        if error is not None:
+            return ExecutionResult(
+                success=False,
+                output="",
+                error=error,
+                exit_code=1,
+                execution_time=0
+            )
 
-        try:
-            result = self.execute_terminal_command(
-                f"python {temp_file.name}",
-                cwd=str(self.workspace),
-                timeout=timeout
+        return self._execute_python_subprocess(code, timeout)
+
+    def _get_worker(self) -> subprocess.Popen:
+        """Return the persistent worker interpreter, (re)spawning if needed."""
+        if self._worker is None or self._worker.poll() is not None:
+            self._worker = subprocess.Popen(
+                [sys.executable, '-u', '-c', _WORKER_DISPATCHER],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                cwd=str(self.workspace)
             )
+        return self._worker
 
-            # Clean up
-            if temp_file.exists():
-                temp_file.unlink()
+    def _execute_python_subprocess(self, code: str, timeout: int) -> ExecutionResult:
+        """Run a snippet in the persistent worker interpreter.
 
-            return result
+        A fresh interpreter per call paid startup plus heavy imports
+        (pandas alone can cost hundreds of ms) every time. The worker is
+        long-lived with a persistent globals dict, so imports and state
+        carry over between cells; it is killed and respawned on timeout
+        or crash.
+        """
+        import time
+        start_time = time.time()
+
+        try:
+            worker = self._get_worker()
+            payload = json.dumps({'code': code}).encode()
+            worker.stdin.write(struct.pack('>I', len(payload)))
+            worker.stdin.write(payload)
+            worker.stdin.flush()
+
+            response: Dict[str, Any] = {}
+
+            def _read():
+                header = worker.stdout.read(4)
+                if len(header) == 4:
+                    (length,) = struct.unpack('>I', header)
+                    response.update(json.loads(worker.stdout.read(length)))
+
+            reader = threading.Thread(target=_read, daemon=True)
+            reader.start()
+            reader.join(timeout)
+
+            if reader.is_alive() or not response:
+                # Timed out or the worker died mid-request - drop it so the
+                # next call gets a fresh interpreter
+                worker.kill()
+                self._worker = None
+                return ExecutionResult(
+                    success=False,
+                    output="",
+                    error=f"Code timed out after {timeout} seconds",
+                    exit_code=-1,
+                    execution_time=timeout
+                )
+
+            self.command_history.append({
+                'command': code,
+                'timestamp': time.time(),
+                'success': response['exit_code'] == 0,
+                'output': response['output'],
+                'error': response['error']
+            })
+
+            return ExecutionResult(
+                success=response['exit_code'] == 0,
+                output=response['output'],
+                error=response['error'],
+                exit_code=response['exit_code'],
+                execution_time=response['execution_time']
+            )
 
         except Exception as e:
+            self._worker = None
             return ExecutionResult(
                 success=False,
                 output="",
                 error=str(e),
                 exit_code=-1,
-                execution_time=0
+                execution_time=time.time() - start_time
             )
 
     def write_file(self, filename: str, content: str, mode: str = 'w') -> ExecutionResult:
@@ -150,12 +290,18 @@ class ComputationalEnvironment:
         """
         try:
             file_path = self.workspace / filename
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+            # The workspace root always exists - only stat/create parents
+            # for nested targets
+            if file_path.parent != self.workspace:
+                file_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(file_path, mode) as f:
-                f.write(content)
+            if mode == 'w':
+                file_path.write_text(content)
+            else:
+                with open(file_path, mode) as f:
+                    f.write(content)
 
-            self.file_cache[filename] = content
+            self.file_cache[filename] = _content_fingerprint(content)
 
             return ExecutionResult(
                 success=True,
@@ -188,7 +334,7 @@ class ComputationalEnvironment:
         try:
             file_path = self.workspace / filename
             content = file_path.read_text()
-            self.file_cache[filename] = content
+            self.file_cache[filename] = _content_fingerprint(content)
             return True, content
         except Exception as e:
             return False, str(e)
@@ -197,13 +343,32 @@ class ComputationalEnvironment:
         """
         List files in the workspace
 
+        Iterative os.scandir walk: DirEntry objects are much cheaper than
+        the per-hit Path construction plus relative_to reallocation that
+        rglob did, and only matches materialize strings.
+
         Args:
-            pattern: Glob pattern
+            pattern: Glob pattern (matched against file names)
 
         Returns:
-            List of file paths
+            List of file paths relative to the workspace
         """
-        return [str(p.relative_to(self.workspace)) for p in self.workspace.rglob(pattern)]
+        base = str(self.workspace)
+        prefix_len = len(base) + 1
+        matches = []
+        stack = [base]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif fnmatch.fnmatch(entry.name, pattern):
+                            matches.append(entry.path[prefix_len:])
+            except OSError:
+                continue
+        return matches
 
     def install_package(self, package: str) -> ExecutionResult:
         """
@@ -217,23 +382,78 @@ class ComputationalEnvironment:
         """
         return self.execute_terminal_command(f"pip install {package}")
 
+    def install_packages(self, packages: List[str]) -> ExecutionResult:
+        """
+        Install several Python packages in one pip invocation
+
+        One `pip install a b c` resolves all requirements together - much
+        faster than N separate pip runs, each of which pays interpreter
+        startup and re-reads the installed-package metadata.
+
+        Args:
+            packages: Package names (e.g., ['pandas', 'numpy'])
+
+        Returns:
+            ExecutionResult
+        """
+        return self.execute_terminal_command(
+            f"pip install {' '.join(packages)}",
+            timeout=120
+        )
+
+    def read_files(self, filenames: List[str]) -> Dict[str, Tuple[bool, str]]:
+        """
+        Read several workspace files concurrently
+
+        Disk reads release the GIL, so a small thread pool overlaps the
+        I/O instead of serializing it.
+
+        Args:
+            filenames: File names relative to the workspace
+
+        Returns:
+            Dict mapping filename -> (success, content)
+        """
+        if not filenames:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(8, len(filenames))) as pool:
+            contents = pool.map(self.read_file, filenames)
+        return dict(zip(filenames, contents))
+
     def get_environment_info(self) -> Dict[str, Any]:
-        """Get information about the computational environment"""
-        return {
+        """Get information about the computational environment
+
+        Cached for one second: the workspace walk and disk-usage syscall
+        are the only parts that change, and callers tend to poll this.
+        The interpreter version comes from sys.version instead of
+        spawning `python --version` per call.
+        """
+        import time
+        now = time.monotonic()
+        if self._env_info_cache is not None and now < self._env_info_cache[0]:
+            return self._env_info_cache[1]
+
+        disk = shutil.disk_usage(self.workspace)
+        info = {
             'workspace': str(self.workspace),
             'files': self.list_files(),
             'command_history_count': len(self.command_history),
             'cached_files': list(self.file_cache.keys()),
-            'python_version': self.execute_terminal_command("python --version").output.strip(),
+            'python_version': f"Python {sys.version.split()[0]}",
             'disk_usage': {
-                'total': shutil.disk_usage(self.workspace).total,
-                'used': shutil.disk_usage(self.workspace).used,
-                'free': shutil.disk_usage(self.workspace).free
+                'total': disk.total,
+                'used': disk.used,
+                'free': disk.free
             }
         }
+        self._env_info_cache = (now + 1.0, info)
+        return info
 
     def cleanup(self):
         """Clean up the workspace"""
+        if self._worker is not None and self._worker.poll() is None:
+            self._worker.kill()
+        self._worker = None
         if self.workspace.exists():
             shutil.rmtree(self.workspace)
 
@@ -43,6 +43,7 @@ export default function LiveBrowserView() {
     try {
       console.log('🔌 Connecting to live browser WebSocket...')
       const ws = new WebSocket(`${WS_BASE_URL}/ws/browser`)
+      ws.binaryType = 'blob'
       wsRef.current = ws
 
       ws.onopen = () => {
@@ -53,17 +54,28 @@ export default function LiveBrowserView() {
 
       ws.onmessage = (event) => {
         try {
+          if (event.data instanceof Blob) {
+            // Raw JPEG frame - metadata arrived in the preceding JSON header
+            renderFrame(event.data)
+            updateFPS()
+            return
+          }
+
           const message = JSON.parse(event.data)
 
           // Debug: Log all message types
           console.log('📨 WebSocket message type:', message.type)
 
           if (message.type === 'frame') {
-            console.log('🖼️  Frame received, size:', message.data?.length || 0)
-            // Render live frame to canvas
-            renderFrame(message.data)
-            setCurrentUrl(message.url)
-            updateFPS()
+            if (message.binary) {
+              // Header only; pixels follow as a binary frame
+              setCurrentUrl(message.url)
+            } else {
+              // Legacy base64 frame
+              renderFrame(message.data)
+              setCurrentUrl(message.url)
+              updateFPS()
+            }
           } else if (message.type === 'connected') {
             console.log('📡 Streaming started:', message.message)
           } else if (message.type === 'command_ack') {
@@ -100,12 +112,16 @@ export default function LiveBrowserView() {
     }
   }
 
-  const renderFrame = (base64Frame) => {
+  const renderFrame = (frame) => {
     const canvas = canvasRef.current
     if (!canvas) return
 
     const ctx = canvas.getContext('2d')
     const img = new Image()
+    const isBlob = frame instanceof Blob
+    const src = isBlob
+      ? URL.createObjectURL(frame)
+      : `data:image/jpeg;base64,${frame}`
 
     img.onload = () => {
       // Resize canvas to match frame dimensions
@@ -116,13 +132,15 @@ export default function LiveBrowserView() {
 
       // Draw frame
       ctx.drawImage(img, 0, 0)
+      if (isBlob) URL.revokeObjectURL(src)
     }
 
     img.onerror = (err) => {
       console.error('❌ Failed to load frame image:', err)
+      if (isBlob) URL.revokeObjectURL(src)
     }
 
-    img.src = `data:image/jpeg;base64,${base64Frame}`
+    img.src = src
   }
 
   const updateFPS = () => {
@@ -50,7 +50,12 @@ export function useRun(sessionId) {
           const message = JSON.parse(event.data)
           console.log('📨 Control message:', message.type, message)
 
-          if (message.type === 'status') {
+          if (message.type === 'batch' || message.type === 'events') {
+            // Server coalesces bursts into one frame - replay each event
+            for (const inner of message.events) {
+              ws.onmessage({ data: JSON.stringify(inner) })
+            }
+          } else if (message.type === 'status') {
             setPhase(message.phase)
           } else if (message.type === 'step_started') {
             const step = message.step
@@ -32,6 +32,7 @@ export function useStream(sessionId) {
     try {
       console.log('🔌 Connecting to browser stream WebSocket...')
       const ws = new WebSocket(`${WS_BASE_URL}/ws/browser`)
+      ws.binaryType = 'blob'
       wsRef.current = ws
 
       ws.onopen = () => {
@@ -41,13 +42,25 @@ export function useStream(sessionId) {
 
       ws.onmessage = (event) => {
         try {
+          if (event.data instanceof Blob) {
+            // Raw JPEG frame - metadata arrived in the preceding JSON header
+            renderFrame(event.data)
+            updateFPS()
+            return
+          }
+
           const message = JSON.parse(event.data)
 
           if (message.type === 'frame') {
-            // Render frame to canvas
-            renderFrame(message.data)
-            setCurrentUrl(message.url)
-            updateFPS()
+            if (message.binary) {
+              // Header only; pixels follow as a binary frame
+              setCurrentUrl(message.url)
+            } else {
+              // Legacy base64 frame
+              renderFrame(message.data)
+              setCurrentUrl(message.url)
+              updateFPS()
+            }
           } else if (message.type === 'connected') {
             console.log('📡 Streaming started:', message.message)
           } else if (message.type === 'ping') {
@@ -78,12 +91,16 @@ export function useStream(sessionId) {
     }
   }, [])
 
-  const renderFrame = useCallback((base64Frame) => {
+  const renderFrame = useCallback((frame) => {
     const canvas = canvasRef.current
     if (!canvas) return
 
     const ctx = canvas.getContext('2d')
     const img = new Image()
+    const isBlob = frame instanceof Blob
+    const src = isBlob
+      ? URL.createObjectURL(frame)
+      : `data:image/jpeg;base64,${frame}`
 
     img.onload = () => {
       // Resize canvas to match frame dimensions
@@ -94,13 +111,15 @@ export function useStream(sessionId) {
 
       // Draw frame
       ctx.drawImage(img, 0, 0)
+      if (isBlob) URL.revokeObjectURL(src)
     }
 
     img.onerror = (err) => {
       console.error('❌ Failed to load frame image:', err)
+      if (isBlob) URL.revokeObjectURL(src)
     }
 
-    img.src = `data:image/jpeg;base64,${base64Frame}`
+    img.src = src
   }, [])
 
   const updateFPS = useCallback(() => {
@@ -13,14 +13,86 @@ Key Features:
 
 import asyncio
 import base64
+import hashlib
+import inspect
 import logging
+import os
+import weakref
 from typing import Optional, Callable, Dict, Any
 from playwright.async_api import async_playwright, Page, Browser, BrowserContext, CDPSession
 import json
 from datetime import datetime
 
+# Level comes from LIVE_BROWSER_LOG_LEVEL so production can silence the
+# per-frame INFO logs without code changes; basicConfig stays a no-op when
+# the embedding app has already configured the root logger
 logger = logging.getLogger("live_browser_manager")
 logging.basicConfig(level=logging.INFO)
+logger.setLevel(os.getenv("LIVE_BROWSER_LOG_LEVEL", "INFO").upper())
+
+# Consecutive duplicate frames before the screencast is paused (~3s at 15fps).
+# Chrome keeps JPEG-encoding every frame while a screencast is running, even
+# on a completely static page - pausing during quiescence drops that CPU cost
+# to zero until the next input or navigation wakes it.
+IDLE_FRAMES_BEFORE_PAUSE = 45
+
+# While paused, briefly resume the screencast this often to catch content
+# that changes without any input (late XHRs, timers, pushed updates) - no
+# CDP event announces those, so the pause would otherwise hide them until
+# the next action
+IDLE_PROBE_INTERVAL = 3.0
+
+# Shared launch/context settings - used by both standalone managers and the
+# context pool so pooled and unpooled sessions behave identically
+BROWSER_LAUNCH_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--window-size=1920,1080',
+    '--disable-dev-shm-usage',  # Prevent shared memory issues
+    '--no-sandbox',  # Required in some environments
+]
+CONTEXT_OPTIONS = {
+    'viewport': {'width': 1920, 'height': 1080},
+    'user_agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+}
+
+# Attached at context creation (pool warmup for pooled contexts) so every
+# page inherits it - no per-page add_init_script await on the start path
+INIT_SCRIPT = "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"
+
+# One-shot element snapshot: the whole walk runs inside the page in a single
+# read-phase layout pass, so a snapshot costs one CDP round-trip no matter
+# how many elements the page has (vs one bounding_box() call per locator)
+_SNAPSHOT_ELEMENTS_JS = """
+    () => {
+        const elements = [];
+        let id = 1;
+
+        const allEls = document.querySelectorAll(
+            'a, button, input, textarea, select, [role="button"], [role="link"]'
+        );
+
+        allEls.forEach(el => {
+            const rect = el.getBoundingClientRect();
+            if (rect.width > 0 && rect.height > 0) {
+                const text = (el.innerText || el.value || el.placeholder ||
+                             el.getAttribute('aria-label') || '').trim();
+                elements.push({
+                    id: id++,
+                    tag: el.tagName.toLowerCase(),
+                    type: el.type || '',
+                    text: text.substring(0, 150),
+                    x: Math.round(rect.left + rect.width / 2),
+                    y: Math.round(rect.top + rect.height / 2),
+                    width: Math.round(rect.width),
+                    height: Math.round(rect.height),
+                    visible: rect.top >= 0 && rect.top <= window.innerHeight
+                });
+            }
+        });
+
+        return elements;
+    }
+"""
 
 
 class LiveBrowserManager:
@@ -40,14 +112,28 @@ class LiveBrowserManager:
         self.frame_callback: Optional[Callable] = None
         self.is_streaming = False
         self._last_url = ""
+        self._cached_url = ""
         self._frame_count = 0
-
-    async def start(self, headless: bool = False) -> Page:
+        self._last_frame_hash: Optional[bytes] = None
+        self._screencast_params: Optional[Dict[str, Any]] = None
+        self._screencast_paused = False
+        self._idle_frame_count = 0
+        self._idle_probe_task: Optional[asyncio.Task] = None
+        self._binary_frames = False
+        self._callback_semaphore = asyncio.Semaphore(4)
+        self._dropped_frames = 0
+        self._owns_browser = True
+
+    async def start(self, headless: bool = False,
+                    context: Optional[BrowserContext] = None) -> Page:
         """
         Start browser with CDP enabled.
 
         Args:
             headless: Whether to run browser in headless mode
+            context: Pre-warmed BrowserContext to bind to (e.g. from
+                     BrowserPool). Skips the multi-second chromium.launch;
+                     the context's lifetime stays with its pool
 
         Returns:
             The created Page object
@@ -56,41 +142,43 @@ class LiveBrowserManager:
             Exception: If browser fails to start
         """
         try:
-            logger.info("🚀 Starting live browser with CDP...")
-
-            self.playwright = await async_playwright().start()
-
-            # Launch Chromium with CDP debugging enabled
-            self.browser = await self.playwright.chromium.launch(
-                headless=headless,
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--window-size=1920,1080',
-                    '--disable-dev-shm-usage',  # Prevent shared memory issues
-                    '--no-sandbox',  # Required in some environments
-                ]
-            )
-
-            # Create context with realistic viewport
-            self.context = await self.browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            )
-
-            # Create page
+            if context is not None:
+                # Bind to a pooled context - no browser launch needed
+                logger.info("🚀 Binding live browser to pooled context...")
+                self.context = context
+                self._owns_browser = False
+            else:
+                logger.info("🚀 Starting live browser with CDP...")
+                self._owns_browser = True
+
+                self.playwright = await async_playwright().start()
+
+                # Launch Chromium with CDP debugging enabled
+                self.browser = await self.playwright.chromium.launch(
+                    headless=headless,
+                    args=BROWSER_LAUNCH_ARGS
+                )
+
+                # Create context with realistic viewport; the init script
+                # lives on the context so pages inherit it
+                self.context = await self.browser.new_context(**CONTEXT_OPTIONS)
+                await self.context.add_init_script(INIT_SCRIPT)
+
+            # Create page (webdriver-hiding init script comes with the context)
             self.page = await self.context.new_page()
 
-            # Hide webdriver detection
-            await self.page.add_init_script(
-                "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"
-            )
-
             # Get CDP session for this page
             self.cdp_session = await self.context.new_cdp_session(self.page)
 
-            # Enable required CDP domains
-            await self.cdp_session.send('Page.enable')
-            await self.cdp_session.send('DOM.enable')
+            # Enable required CDP domains - independent, so issue in parallel
+            await asyncio.gather(
+                self.cdp_session.send('Page.enable'),
+                self.cdp_session.send('DOM.enable'),
+            )
+
+            # Track the current URL from navigation events instead of
+            # reading page.url on every screencast frame
+            self.cdp_session.on('Page.frameNavigated', self._on_frame_navigated)
 
             logger.info("✅ Live browser started successfully")
             logger.info(f"   Browser: Chromium (CDP enabled)")
@@ -104,13 +192,24 @@ class LiveBrowserManager:
             await self.close()
             raise
 
-    async def start_streaming(self, frame_callback: Callable[[str, str], None], fps: int = 15):
+    async def start_streaming(self, frame_callback: Callable[[str, str], None],
+                              fps: int = 15, binary: bool = False,
+                              quality: int = 60, max_width: int = 1280,
+                              max_height: int = 720):
         """
         Start streaming browser frames via CDP.
 
         Args:
             frame_callback: Async function called with (frame_data, url) for each frame
             fps: Target frames per second (default 15, max ~30)
+            binary: Deliver frames as raw JPEG bytes instead of base64 strings.
+                    Base64 inflates every frame by ~33%; binary-capable
+                    transports (websocket send_bytes) should prefer raw bytes
+            quality: JPEG quality (0-100). 60 is visually fine for agent
+                     observation at a fraction of the encode cost of 85
+            max_width: Frame width cap; JPEG encode cost scales with pixels,
+                       so 1280x720 is ~4x cheaper than full 1920x1080
+            max_height: Frame height cap
         """
         if not self.cdp_session:
             raise RuntimeError("Browser not started. Call start() first.")
@@ -119,8 +218,15 @@ class LiveBrowserManager:
             logger.warning("⚠️  Streaming already active")
             return
 
-        self.frame_callback = frame_callback
+        # Bound methods are held weakly so a streaming manager never keeps a
+        # dead consumer (and whatever state it closes over) alive; plain
+        # functions/closures keep a strong ref since callers own their scope
+        if inspect.ismethod(frame_callback):
+            self.frame_callback = weakref.WeakMethod(frame_callback)
+        else:
+            self.frame_callback = frame_callback
         self.is_streaming = True
+        self._binary_frames = binary
         self._frame_count = 0
 
         # Calculate frame interval (skip frames to achieve target FPS)
@@ -134,14 +240,20 @@ class LiveBrowserManager:
             # Subscribe to screencast frames
             self.cdp_session.on('Page.screencastFrame', self._handle_frame)
 
-            # Start screencast with CDP
-            await self.cdp_session.send('Page.startScreencast', {
+            # Keep the params so the idle controller can restart the
+            # screencast after pausing it during quiescence
+            self._screencast_params = {
                 'format': 'jpeg',
-                'quality': 85,  # Balance quality vs bandwidth
-                'maxWidth': 1920,
-                'maxHeight': 1080,
+                'quality': quality,
+                'maxWidth': max_width,
+                'maxHeight': max_height,
                 'everyNthFrame': every_nth_frame
-            })
+            }
+            self._screencast_paused = False
+            self._idle_frame_count = 0
+
+            # Start screencast with CDP
+            await self.cdp_session.send('Page.startScreencast', self._screencast_params)
 
             logger.info("✅ Live streaming started successfully")
 
@@ -150,6 +262,16 @@ class LiveBrowserManager:
             self.is_streaming = False
             raise
 
+    def _on_frame_navigated(self, params: Dict[str, Any]):
+        """Keep the cached URL current from CDP navigation events.
+
+        page.url is a driver-level read; at 15-30fps polling it per frame
+        adds up. Main-frame navigations are the only time it changes.
+        """
+        frame = params.get('frame', {})
+        if frame.get('parentId') is None:
+            self._cached_url = frame.get('url', '')
+
     async def _handle_frame(self, params: Dict[str, Any]):
         """
         Handle incoming frame from CDP screencast.
@@ -162,46 +284,179 @@ class LiveBrowserManager:
             session_id = params.get('sessionId')
             metadata = params.get('metadata', {})
 
-            # CRITICAL: Acknowledge frame to continue receiving more frames
-            await self.cdp_session.send('Page.screencastFrameAck', {
+            # CRITICAL: Acknowledge frame to continue receiving more frames.
+            # Fire-and-forget so a slow client callback never stalls the ack
+            # chain - CDP holds the next frame until the ack arrives.
+            asyncio.create_task(self.cdp_session.send('Page.screencastFrameAck', {
                 'sessionId': session_id
-            })
+            }))
 
             self._frame_count += 1
 
-            # Get current URL
-            current_url = self.page.url if self.page else ''
+            # Current URL comes from the frameNavigated cache - no per-frame
+            # page.url read
+            current_url = self._cached_url
 
             # Only log URL changes to reduce noise
             if current_url != self._last_url:
-                logger.info(f"🌐 URL changed: {current_url}")
                 self._last_url = current_url
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(f"🌐 URL changed: {current_url}")
 
-            # Send frame to callback
+            # Send frame to callback, skipping frames identical to the last
+            # one (static page, paused video) - saves ~100-300KB of websocket
+            # egress per duplicate at 15fps. The Ack above still fires so CDP
+            # keeps delivering frames.
             if self.frame_callback and frame_data:
-                try:
-                    await self.frame_callback(frame_data, current_url)
-                except Exception as callback_error:
-                    logger.error(f"❌ Frame callback error: {callback_error}")
-
-            # Log frame stats every 100 frames
-            if self._frame_count % 100 == 0:
+                frame_hash = hashlib.sha256(frame_data.encode('ascii')).digest()
+                if frame_hash != self._last_frame_hash:
+                    self._last_frame_hash = frame_hash
+                    self._idle_frame_count = 0
+                    # Dispatch the callback as its own task so client I/O
+                    # runs concurrently with frame handling. At most 4
+                    # in-flight deliveries; beyond that the client can't keep
+                    # up, so drop the frame rather than queue unboundedly.
+                    if self._callback_semaphore.locked():
+                        self._dropped_frames += 1
+                        if self._dropped_frames % 100 == 0:
+                            logger.warning(
+                                f"⚠️  Dropped {self._dropped_frames} frames (slow client)")
+                    else:
+                        # Decode once here for binary consumers; base64 only
+                        # survives for legacy JSON clients
+                        payload = base64.b64decode(frame_data) if self._binary_frames else frame_data
+                        asyncio.create_task(self._deliver_frame(payload, current_url))
+                else:
+                    # Page is visually quiescent; after a sustained run of
+                    # duplicates, pause the screencast so Chrome stops
+                    # encoding frames. Any input or navigation wakes it.
+                    self._idle_frame_count += 1
+                    if (self._idle_frame_count >= IDLE_FRAMES_BEFORE_PAUSE
+                            and not self._screencast_paused):
+                        self._screencast_paused = True
+                        await self.cdp_session.send('Page.stopScreencast')
+                        logger.info("💤 Screencast paused (page idle)")
+                        if self._idle_probe_task is None or self._idle_probe_task.done():
+                            self._idle_probe_task = asyncio.create_task(self._idle_probe())
+
+            # Log frame stats every 100 frames. isEnabledFor guards keep
+            # this hottest-path function from building f-strings that a
+            # raised production log level would just discard
+            if self._frame_count % 100 == 0 and logger.isEnabledFor(logging.INFO):
                 logger.info(f"📊 Streamed {self._frame_count} frames")
 
         except Exception as e:
             logger.error(f"❌ Error handling frame: {e}")
 
+    async def set_quality(self, quality: int, max_width: Optional[int] = None,
+                          max_height: Optional[int] = None):
+        """
+        Change screencast quality/dimensions on the fly.
+
+        CDP can't change parameters of a running screencast, so this
+        restarts it with the new settings. Callers can downshift when a
+        client reports it can't keep up and upshift back later.
+
+        Args:
+            quality: New JPEG quality (0-100)
+            max_width: New width cap, or None to keep the current one
+            max_height: New height cap, or None to keep the current one
+        """
+        if not self._screencast_params:
+            raise RuntimeError("Streaming not started. Call start_streaming() first.")
+
+        self._screencast_params['quality'] = quality
+        if max_width is not None:
+            self._screencast_params['maxWidth'] = max_width
+        if max_height is not None:
+            self._screencast_params['maxHeight'] = max_height
+
+        if self.is_streaming and not self._screencast_paused:
+            await self.cdp_session.send('Page.stopScreencast')
+            self._last_frame_hash = None  # Dimensions changed; never dedup
+            await self.cdp_session.send('Page.startScreencast', self._screencast_params)
+            logger.info(f"🎚️  Screencast quality set to {quality} "
+                        f"({self._screencast_params['maxWidth']}x{self._screencast_params['maxHeight']})")
+
+    async def _deliver_frame(self, payload, url: str):
+        """Run the frame callback under the delivery semaphore."""
+        async with self._callback_semaphore:
+            callback = self.frame_callback
+            if isinstance(callback, weakref.WeakMethod):
+                callback = callback()  # None once the consumer is collected
+            if callback is None:  # Streaming stopped or consumer gone
+                return
+            try:
+                await callback(payload, url)
+            except Exception as callback_error:
+                logger.error(f"❌ Frame callback error: {callback_error}")
+
+    async def _idle_probe(self):
+        """Briefly resume a paused screencast every few seconds.
+
+        Input actions wake the screencast explicitly, but content can also
+        change with no input at all - a slow XHR filling in after the page
+        went static, timers, pushed updates. No CDP event announces those,
+        so while paused the screencast is restarted periodically with the
+        idle counter primed one short of the threshold: a changed frame
+        resets it and streaming continues, an unchanged one re-pauses on
+        arrival, and the probe keeps cycling.
+        """
+        try:
+            while self.is_streaming:
+                await asyncio.sleep(IDLE_PROBE_INTERVAL)
+                if not self.is_streaming or self.cdp_session is None:
+                    return
+                if not self._screencast_paused:
+                    return  # an input wake resumed streaming for real
+                self._idle_frame_count = IDLE_FRAMES_BEFORE_PAUSE - 1
+                self._screencast_paused = False
+                await self.cdp_session.send('Page.startScreencast', self._screencast_params)
+                # Let the probe frame arrive and settle the paused state
+                await asyncio.sleep(1.0)
+                if not self._screencast_paused:
+                    return  # the page changed; normal streaming took over
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"❌ Idle probe error: {e}")
+
+    async def wake_screencast(self):
+        """
+        Resume a screencast paused by the idle controller.
+
+        Called before every input/navigation so interactive pages stream
+        exactly as before; idle pages cost nothing in between.
+        """
+        if not (self.is_streaming and self._screencast_paused):
+            return
+
+        try:
+            self._screencast_paused = False
+            self._idle_frame_count = 0
+            self._last_frame_hash = None  # Always deliver the first frame back
+            await self.cdp_session.send('Page.startScreencast', self._screencast_params)
+            logger.info("⏰ Screencast resumed (activity detected)")
+
+        except Exception as e:
+            logger.error(f"❌ Failed to resume screencast: {e}")
+
     async def stop_streaming(self):
         """Stop streaming browser frames."""
         if not self.is_streaming:
             return
 
         try:
-            if self.cdp_session:
+            if self.cdp_session and not self._screencast_paused:
                 await self.cdp_session.send('Page.stopScreencast')
 
             self.is_streaming = False
             self.frame_callback = None
+            self._screencast_paused = False
+            self._idle_frame_count = 0
+            if self._idle_probe_task is not None:
+                self._idle_probe_task.cancel()
+                self._idle_probe_task = None
 
             logger.info(f"⏹️  Stopped streaming (total frames: {self._frame_count})")
 
@@ -222,7 +477,10 @@ class LiveBrowserManager:
 
         try:
             logger.info(f"🔗 Navigating to: {url}")
+            self._last_frame_hash = None  # New page - never dedup its first frame
+            await self.wake_screencast()
             await self.page.goto(url, wait_until=wait_until, timeout=30000)
+            self._cached_url = self.page.url
             logger.info(f"✅ Navigation complete: {url}")
 
         except Exception as e:
@@ -242,26 +500,35 @@ class LiveBrowserManager:
 
         try:
             logger.info(f"🖱️  Clicking at ({x}, {y})")
+            await self.wake_screencast()
             await self.page.mouse.click(x, y)
 
         except Exception as e:
             logger.error(f"❌ Click failed: {e}")
             raise
 
-    async def type_text(self, text: str, delay: int = 50):
+    async def type_text(self, text: str, delay: int = 50, human: bool = False):
         """
         Type text at current focus.
 
         Args:
             text: Text to type
-            delay: Delay between keystrokes in milliseconds
+            delay: Delay between keystrokes in milliseconds (human mode only)
+            human: Emit per-key KeyDown/KeyUp events with delays, for sites
+                   with bot detection. Off by default: insert_text delivers
+                   the whole string in a single Input.insertText CDP call
+                   instead of two events per character
         """
         if not self.page:
             raise RuntimeError("Browser not started")
 
         try:
             logger.info(f"⌨️  Typing: {text[:50]}{'...' if len(text) > 50 else ''}")
-            await self.page.keyboard.type(text, delay=delay)
+            await self.wake_screencast()
+            if human:
+                await self.page.keyboard.type(text, delay=delay)
+            else:
+                await self.page.keyboard.insert_text(text)
 
         except Exception as e:
             logger.error(f"❌ Typing failed: {e}")
@@ -278,6 +545,7 @@ class LiveBrowserManager:
             raise RuntimeError("Browser not started")
 
         try:
+            await self.wake_screencast()
             await self.page.mouse.wheel(0, delta_y)
 
         except Exception as e:
@@ -295,12 +563,74 @@ class LiveBrowserManager:
             raise RuntimeError("Browser not started")
 
         try:
+            await self.wake_screencast()
             await self.page.keyboard.press(key)
 
         except Exception as e:
             logger.error(f"❌ Key press failed: {e}")
             raise
 
+    async def chain(self, actions: list) -> Dict[str, Any]:
+        """
+        Execute a sequence of actions in one call, then observe the result.
+
+        Each agent tool call normally pays its own Python->driver round-trip
+        plus a follow-up observation trip. Chaining related sub-steps (e.g.
+        click -> type -> press Enter) into one entry point amortizes that
+        latency: N actions cost one call, and the URL/title observation is
+        appended automatically at the end.
+
+        Args:
+            actions: List of dicts like {'op': 'click', 'x': .., 'y': ..},
+                     {'op': 'type', 'text': ..}, {'op': 'press', 'key': ..},
+                     {'op': 'scroll', 'delta_y': ..}, {'op': 'navigate', 'url': ..}
+
+        Returns:
+            Dictionary with url, title, viewport after the sequence settles
+        """
+        if not self.page:
+            raise RuntimeError("Browser not started")
+
+        for action in actions:
+            op = action.get('op')
+            if op == 'click':
+                await self.click(int(action['x']), int(action['y']))
+            elif op == 'type':
+                await self.type_text(action['text'], delay=action.get('delay', 50))
+            elif op == 'press':
+                await self.press_key(action['key'])
+            elif op == 'scroll':
+                await self.scroll(int(action['delta_y']))
+            elif op == 'navigate':
+                await self.navigate(action['url'])
+            else:
+                raise ValueError(f"Unknown chain op: {op}")
+
+        # Let the page settle, but don't block on pages that never go idle
+        try:
+            await self.page.wait_for_load_state('networkidle', timeout=1500)
+        except Exception:
+            pass
+
+        return {
+            'url': self.page.url,
+            'title': await self.page.title(),
+            'viewport': self.page.viewport_size,
+        }
+
+    async def snapshot_elements(self) -> list:
+        """
+        Capture all interactive elements on the page in one CDP call.
+
+        Returns:
+            List of element dicts (id, tag, type, text, center x/y, size,
+            visibility) suitable for driving click()/chain() by coordinate
+        """
+        if not self.page:
+            raise RuntimeError("Browser not started")
+
+        return await self.page.evaluate(_SNAPSHOT_ELEMENTS_JS)
+
     async def get_page_info(self) -> Dict[str, Any]:
         """
         Get current page information.
@@ -348,12 +678,14 @@ class LiveBrowserManager:
                     pass
                 self.page = None
 
-            # Close context
+            # Close context - pooled contexts belong to their pool, which
+            # recycles them after we detach
             if self.context:
-                try:
-                    await self.context.close()
-                except:
-                    pass
+                if self._owns_browser:
+                    try:
+                        await self.context.close()
+                    except:
+                        pass
                 self.context = None
 
             # Close browser
@@ -378,33 +710,166 @@ class LiveBrowserManager:
             logger.error(f"❌ Error closing browser: {e}")
 
 
-# Singleton instance for the live browser
-_live_browser_instance: Optional[LiveBrowserManager] = None
+class BrowserPool:
+    """
+    Pool of pre-warmed BrowserContexts inside a single launched Chromium.
+
+    Launching a browser per session costs 1-3s and ~150MB RSS; contexts in
+    an already-running browser are ~100ms and share the Chromium process.
+    acquire() hands out a warm context (creating up to max_size), release()
+    wipes its state and returns it for reuse.
+    """
+
+    def __init__(self, max_size: int = 4):
+        self.playwright = None
+        self.browser: Optional[Browser] = None
+        self.max_size = max_size
+        self._warm: asyncio.Queue = asyncio.Queue()
+        self._created = 0
+
+    async def start(self, headless: bool = True, prewarm: int = 2):
+        """Launch the shared browser and pre-warm some contexts."""
+        logger.info("🚀 Starting browser pool...")
+        self.playwright = await async_playwright().start()
+        self.browser = await self.playwright.chromium.launch(
+            headless=headless,
+            args=BROWSER_LAUNCH_ARGS
+        )
+        for _ in range(min(prewarm, self.max_size)):
+            self._warm.put_nowait(await self._new_context())
+            self._created += 1
+        logger.info(f"✅ Browser pool ready ({self._created} warm context(s))")
+
+    async def _new_context(self) -> BrowserContext:
+        """Create a context with the init script already attached, so
+        binding a session to it later skips that setup await."""
+        context = await self.browser.new_context(**CONTEXT_OPTIONS)
+        await context.add_init_script(INIT_SCRIPT)
+        return context
+
+    async def acquire(self) -> BrowserContext:
+        """Get a context: warm one if available, new one below the cap,
+        otherwise wait for a release."""
+        try:
+            return self._warm.get_nowait()
+        except asyncio.QueueEmpty:
+            pass
+
+        if self._created < self.max_size:
+            self._created += 1
+            return await self._new_context()
+
+        return await self._warm.get()
+
+    async def release(self, context: BrowserContext):
+        """Wipe a context's state and return it to the pool."""
+        try:
+            for page in context.pages:
+                await page.close()
+            await context.clear_cookies()
+            # Cookies alone don't cover localStorage/sessionStorage/IndexedDB
+            # etc., which would leak from one session into the next one to
+            # recycle this context. CDP clears every origin's storage in one
+            # call; it needs a page to attach to, so open a throwaway one.
+            page = await context.new_page()
+            cdp = await context.new_cdp_session(page)
+            await cdp.send('Storage.clearDataForOrigin',
+                           {'origin': '*', 'storageTypes': 'all'})
+            await cdp.detach()
+            await page.close()
+        except Exception:
+            # Context is broken - drop it so acquire() can mint a fresh one
+            self._created -= 1
+            try:
+                await context.close()
+            except Exception:
+                pass
+            return
+
+        self._warm.put_nowait(context)
+
+    async def close(self):
+        """Close the shared browser and everything in it."""
+        if self.browser:
+            try:
+                await self.browser.close()
+            except Exception:
+                pass
+            self.browser = None
+
+        if self.playwright:
+            try:
+                await self.playwright.stop()
+            except Exception:
+                pass
+            self.playwright = None
+
+
+# Live browser instances keyed by session id. Concurrent agent sessions get
+# independent pooled contexts instead of fighting over a single shared page;
+# callers that don't care about sessions keep the old singleton behavior via
+# the default key. All sessions share one pooled Chromium.
+_live_browser_instances: Dict[str, LiveBrowserManager] = {}
+_browser_pool: Optional[BrowserPool] = None
 _browser_lock = asyncio.Lock()
 
+_DEFAULT_SESSION = "default"
+
 
-async def get_live_browser() -> LiveBrowserManager:
+async def get_live_browser(session_id: str = _DEFAULT_SESSION) -> LiveBrowserManager:
     """
-    Get or create the singleton live browser instance.
+    Get or create the live browser instance for a session.
+
+    Args:
+        session_id: Session to look up; omit for the shared default browser
 
     Returns:
-        The global LiveBrowserManager instance
+        The LiveBrowserManager instance for that session
     """
-    global _live_browser_instance
+    global _browser_pool
 
     async with _browser_lock:
-        if _live_browser_instance is None:
-            _live_browser_instance = LiveBrowserManager()
-            await _live_browser_instance.start(headless=True)
+        instance = _live_browser_instances.get(session_id)
+        if instance is None:
+            if _browser_pool is None:
+                _browser_pool = BrowserPool()
+                await _browser_pool.start(headless=True)
 
-        return _live_browser_instance
+            context = await _browser_pool.acquire()
+            instance = LiveBrowserManager()
+            await instance.start(context=context)
+            _live_browser_instances[session_id] = instance
 
+        return instance
 
-async def close_live_browser():
-    """Close the singleton live browser instance."""
-    global _live_browser_instance
+
+async def close_live_browser(session_id: Optional[str] = None):
+    """
+    Close live browser instances.
+
+    Args:
+        session_id: Session to close; omit to close every open instance
+    """
+    global _browser_pool
+
+    async def _close_instance(instance: LiveBrowserManager):
+        # Grab the pooled context before close() detaches from it
+        pooled_ctx = instance.context if not instance._owns_browser else None
+        await instance.close()
+        if pooled_ctx is not None and _browser_pool is not None:
+            await _browser_pool.release(pooled_ctx)
 
     async with _browser_lock:
-        if _live_browser_instance:
-            await _live_browser_instance.close()
-            _live_browser_instance = None
+        if session_id is not None:
+            instance = _live_browser_instances.pop(session_id, None)
+            if instance:
+                await _close_instance(instance)
+            return
+
+        for instance in _live_browser_instances.values():
+            await _close_instance(instance)
+        _live_browser_instances.clear()
+
+        if _browser_pool is not None:
+            await _browser_pool.close()
+            _browser_pool = None